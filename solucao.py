@@ -1,6 +1,18 @@
 from typing import Iterable, Set, Tuple
-import heapq
-from heapq import heappush, heappop
+from collections import deque
+from math import inf
+
+from tabuleiro import ACOES, HAMMING, MANHATTAN, OBJETIVO_EMPACOTADO, VIZINHOS, empacota
+
+try:
+    import solucao_cython
+except ImportError:  # Extensão opcional, compilada com: cythonize -i solucao_cython.pyx
+    solucao_cython = None
+
+try:
+    import solucao_numba
+except ImportError:  # Numba é opcional; sem ela a busca usa a implementação em Python puro
+    solucao_numba = None
 
 class Nodo:
     """
@@ -9,6 +21,9 @@ class Nodo:
     a ação que levou a esse nó e o custo do caminho até esse nó.
     """
 
+    # Evita um __dict__ por instância (as buscas não usam Nodo; apenas a função expande os cria)
+    __slots__ = ("estado", "pai", "acao", "custo")
+
     def __init__(self, estado: str, pai: 'Nodo' = None, acao: str = None, custo: int = 0):
         """
         Inicializa o nodo com os atributos recebidos
@@ -21,7 +36,6 @@ class Nodo:
         self.pai = pai  
         self.acao = acao
         self.custo = custo
-        self.filhos = []  # Lista para armazenar os nós filhos 
 
     def __eq__(self, other):
         """
@@ -50,6 +64,114 @@ class Nodo:
         return hash(self.estado)
 
 
+class FilaDeBaldes:
+    """
+    Fila de prioridade para prioridades inteiras pequenas e não negativas, como os custos f(n)
+    do 8-puzzle. Cada prioridade tem seu próprio balde (deque), então inserção e remoção são
+    O(1) amortizado e itens com a mesma prioridade saem em ordem FIFO.
+    """
+
+    def __init__(self, num_baldes: int = 64):
+        """
+        Inicializa a fila vazia
+        :param num_baldes:int, quantidade inicial de baldes (a fila cresce se necessário)
+        """
+        self.baldes = [deque() for _ in range(num_baldes)]
+        self.menor = num_baldes
+        self.tamanho = 0
+
+    def __len__(self):
+        """
+        retorna a quantidade de itens na fila
+        """
+        return self.tamanho
+
+    def insere(self, prioridade: int, item):
+        """
+        insere um item com a prioridade recebida
+        """
+        while prioridade >= len(self.baldes):
+            self.baldes.append(deque())
+        self.baldes[prioridade].append(item)
+        self.menor = min(self.menor, prioridade)
+        self.tamanho += 1
+
+    def remove(self):
+        """
+        remove e retorna o item mais antigo dentre os de menor prioridade
+        """
+        while not self.baldes[self.menor]:
+            self.menor += 1
+        self.tamanho -= 1
+        return self.baldes[self.menor].popleft()
+
+
+def _calcula_tabelas_conflitos() -> tuple[list[list[int]], list[list[int]]]:
+    """
+    Calcula o custo de conflitos lineares de cada linha e de cada coluna do tabuleiro,
+    indexado pelas três peças da linha (ou coluna) empacotadas em 12 bits.
+    Dentre as peças que estão na sua linha (coluna) correta, as que precisam sair da linha
+    para que as demais fiquem em ordem são as que não pertencem à maior subsequência
+    crescente de colunas (linhas) corretas; cada uma delas custa 2 movimentos extras.
+    :return: tuple[list[list[int]], list[list[int]]]
+    """
+    conflitos_linhas = [[0] * 4096 for _ in range(3)]
+    conflitos_colunas = [[0] * 4096 for _ in range(3)]
+    for p0 in range(9):
+        for p1 in range(9):
+            for p2 in range(9):
+                chave = p0 | (p1 << 4) | (p2 << 8)
+                for indice in range(3):
+                    # Posição correta, na direção da linha, de cada peça que pertence a ela
+                    na_linha = [(peca - 1) % 3 for peca in (p0, p1, p2) if peca != 0 and (peca - 1) // 3 == indice]
+                    na_coluna = [(peca - 1) // 3 for peca in (p0, p1, p2) if peca != 0 and (peca - 1) % 3 == indice]
+                    conflitos_linhas[indice][chave] = 2 * (len(na_linha) - _maior_subsequencia_crescente(na_linha))
+                    conflitos_colunas[indice][chave] = 2 * (len(na_coluna) - _maior_subsequencia_crescente(na_coluna))
+    return conflitos_linhas, conflitos_colunas
+
+
+def _maior_subsequencia_crescente(sequencia: list[int]) -> int:
+    """
+    Calcula o tamanho da maior subsequência estritamente crescente de uma sequência curta.
+    :param sequencia: list[int]
+    :return: int
+    """
+    maiores = []
+    for i in range(len(sequencia)):
+        maiores.append(1 + max((maiores[j] for j in range(i) if sequencia[j] < sequencia[i]), default=0))
+    return max(maiores, default=0)
+
+
+# Custo de conflitos lineares de cada linha e coluna, indexado pelas peças nela
+CONFLITOS_LINHAS, CONFLITOS_COLUNAS = _calcula_tabelas_conflitos()
+
+
+def _troca_nibbles(estado: int, i: int, j: int) -> int:
+    """
+    Troca o conteúdo das posições i e j de um estado empacotado.
+    :param estado: int
+    :param i: int
+    :param j: int
+    :return: int
+    """
+    mascara_i = 0xF << (4 * i)
+    mascara_j = 0xF << (4 * j)
+    peca_i = (estado & mascara_i) >> (4 * i)
+    peca_j = (estado & mascara_j) >> (4 * j)
+    return (estado & ~(mascara_i | mascara_j)) | (peca_i << (4 * j)) | (peca_j << (4 * i))
+
+
+def _sucessor_empacotado(estado: int, vazio: int) -> list[tuple[int, int, int]]:
+    """
+    Versão da função sucessor para estados empacotados. Recebe o estado e a posição
+    do espaço vazio e retorna uma lista de tuplas (código da ação, estado atingido, nova posição do vazio).
+    :param estado: int
+    :param vazio: int
+    :return: list[tuple[int, int, int]]
+    """
+    return [(acao, _troca_nibbles(estado, vazio, novo_vazio), novo_vazio) for acao, novo_vazio in VIZINHOS[vazio]]
+
+
 def sucessor(estado: str) -> Set[Tuple[str, str]]:
     """
     Recebe um estado (string) e retorna um conjunto de tuplas (ação,estado atingido)
@@ -60,10 +182,6 @@ def sucessor(estado: str) -> Set[Tuple[str, str]]:
     """
     espacoVazio = estado.rfind("_")
     
-    # Calcula a linha e coluna correspondentes à posição do espaço vazio
-    linha = espacoVazio // 3
-    coluna = espacoVazio % 3
-    
     retorno = []
     
     # Função auxiliar para trocar dois caracteres em uma string
@@ -72,25 +190,9 @@ def sucessor(estado: str) -> Set[Tuple[str, str]]:
         estado[i], estado[j] = estado[j], estado[i]
         return ''.join(estado)
 
-    # Verifica se é possível mover para a esquerda
-    if coluna > 0:
-        novo_estado = trocar(estado, espacoVazio, espacoVazio - 1)
-        retorno.append(("esquerda", novo_estado))
-
-    # Verifica se é possível mover para a direita
-    if coluna < 2:
-        novo_estado = trocar(estado, espacoVazio, espacoVazio + 1)
-        retorno.append(("direita", novo_estado))
-
-    # Verifica se é possível mover para cima
-    if linha > 0:
-        novo_estado = trocar(estado, espacoVazio, espacoVazio - 3)
-        retorno.append(("acima", novo_estado))
-
-    # Verifica se é possível mover para baixo
-    if linha < 2:
-        novo_estado = trocar(estado, espacoVazio, espacoVazio + 3)
-        retorno.append(("abaixo", novo_estado))
+    # A tabela VIZINHOS já contém apenas os movimentos possíveis para esta posição do espaço vazio
+    for acao, novo_vazio in VIZINHOS[espacoVazio]:
+        retorno.append((ACOES[acao], trocar(estado, espacoVazio, novo_vazio)))
 
     return retorno
 
@@ -120,6 +222,22 @@ def expande(nodo: Nodo) -> Set[Nodo]:
     return nodos_sucessores
 
 
+def _reconstroi_caminho(came_from: dict[int, tuple[int, int]], estado: int) -> list[str]:
+    """
+    Reconstrói a lista de ações que leva da raiz até o estado recebido,
+    percorrendo came_from de trás para frente e convertendo os códigos das ações em strings.
+    :param came_from: dict, mapeia cada estado para (estado pai, código da ação)
+    :param estado: int
+    :return: list[str]
+    """
+    caminho = []
+    while estado in came_from:
+        estado, acao = came_from[estado]
+        caminho.append(ACOES[acao])
+    caminho.reverse()
+    return caminho
+
+
 def astar_hamming(estado: str) -> list[str] | None:
     """
     Recebe um estado (string), executa a busca A* com h(n) = soma das distâncias de Hamming e
@@ -129,39 +247,50 @@ def astar_hamming(estado: str) -> list[str] | None:
     :param estado: str
     :return:
     """
-    objetivo = "12345678_"
-
-    nodo_raiz = Nodo(estado)
+    estado_raiz = empacota(estado)
 
     explorados = set()
 
-    # Fila de prioridade para a fronteira, ordenada pelo custo f(n) = g(n) + h(n)
-    fronteira = []
+    # Menor custo g(n) conhecido para cada estado
+    g_score = {estado_raiz: 0}
 
-    # Adiciona o nó raiz à fronteira
-    heappush(fronteira, (hamming_heuristic(nodo_raiz.estado), nodo_raiz))
+    # Para cada estado atingido: (estado pai, código da ação que leva do pai ao estado)
+    came_from = {}
+
+    # Fila de prioridade para a fronteira, ordenada pelo custo f(n) = g(n) + h(n).
+    # Cada entrada é uma tupla (g(n), estado, posição do vazio, h(n))
+    fronteira = FilaDeBaldes()
+
+    # Adiciona o estado raiz à fronteira
+    custo_h = _hamming_empacotado(estado_raiz)
+    fronteira.insere(custo_h, (0, estado_raiz, estado.index("_"), custo_h))
 
     while fronteira:
-        # Extrai o nó com menor custo f(n) da fronteira
-        _, nodo_atual = heappop(fronteira)
-
-        # Verifica se o nó atual é o objetivo
-        if nodo_atual.estado == objetivo:
-            # Reconstrói o caminho a partir do nó objetivo
-            caminho = []
-            while nodo_atual.pai is not None:
-                caminho.append(nodo_atual.acao)
-                nodo_atual = nodo_atual.pai
-            caminho.reverse()
-            return caminho
-
-        explorados.add(nodo_atual.estado)
-
-        # Expande o nó atual e adiciona os sucessores não explorados à fronteira
-        for nodo_sucessor in expande(nodo_atual):
-            if nodo_sucessor.estado not in explorados:
-                custo_f = nodo_sucessor.custo + hamming_heuristic(nodo_sucessor.estado)
-                heappush(fronteira, (custo_f, nodo_sucessor))
+        # Extrai a entrada com menor custo f(n) da fronteira
+        custo_atual, estado_atual, vazio_atual, h_atual = fronteira.remove()
+
+        # Um estado pode ter entrado na fronteira mais de uma vez; só a primeira retirada é expandida
+        if estado_atual in explorados:
+            continue
+
+        # Verifica se o estado atual é o objetivo
+        if estado_atual == OBJETIVO_EMPACOTADO:
+            return _reconstroi_caminho(came_from, estado_atual)
+
+        explorados.add(estado_atual)
+
+        # Gera os sucessores e adiciona à fronteira os que melhoram g(n)
+        for acao, novo_estado, novo_vazio in _sucessor_empacotado(estado_atual, vazio_atual):
+            custo_g = custo_atual + 1
+            # Os estados explorados já têm g(n) ótimo (as heurísticas são consistentes),
+            # então o teste contra g_score também descarta os já explorados
+            if custo_g < g_score.get(novo_estado, inf):
+                g_score[novo_estado] = custo_g
+                came_from[novo_estado] = (estado_atual, acao)
+                # Apenas a peça movida muda de posição, então h(n) é atualizado a partir do pai
+                indice = ((estado_atual >> (4 * novo_vazio)) & 0xF) * 9
+                custo_h = h_atual - HAMMING[indice + novo_vazio] + HAMMING[indice + vazio_atual]
+                fronteira.insere(custo_g + custo_h, (custo_g, novo_estado, novo_vazio, custo_h))
 
     return None
 
@@ -171,12 +300,23 @@ def hamming_heuristic(estado: str) -> int:
     :param estado: str
     :return: int
     """
-    objetivo = "12345678_"
-    distancia = 0
-    for i in range(9):
-        if estado[i] != objetivo[i] and estado[i] != "_":
-            distancia += 1
-    return distancia
+    return _hamming_empacotado(empacota(estado))
+
+
+def _hamming_empacotado(estado: int) -> int:
+    """
+    Calcula a distância de Hamming para um estado empacotado sem percorrer as posições:
+    o XOR com o objetivo zera os nibbles das posições corretas, e cada nibble restante
+    é reduzido a um único bit antes da contagem.
+    :param estado: int
+    :return: int
+    """
+    diferenca = estado ^ OBJETIVO_EMPACOTADO
+    diferenca |= diferenca >> 1
+    diferenca |= diferenca >> 2
+    diferenca &= 0x111111111
+    # Se o vazio não está na última posição, a posição dele também foi contada
+    return diferenca.bit_count() - (estado >> 32 != 0)
 
 
 def astar_manhattan(estado: str) -> list[str] | None:
@@ -184,61 +324,208 @@ def astar_manhattan(estado: str) -> list[str] | None:
     Recebe um estado (string), executa a busca A* com h(n) = soma das distâncias de Manhattan e
     retorna uma lista de ações que leva do estado recebido até o objetivo ("12345678_").
     Caso não haja solução a partir do estado recebido, retorna None.
+    Usa a versão compilada disponível (Cython, depois Numba) ou, na falta delas, a versão em Python puro.
+    :param estado: str
+    :return: list[str] | None
+    """
+    if solucao_cython is not None:
+        return _astar_manhattan_cython(estado)
+    if solucao_numba is not None:
+        return _astar_manhattan_numba(estado)
+    return _astar_manhattan_python(estado)
+
+
+def _astar_manhattan_cython(estado: str) -> list[str] | None:
+    """
+    Executa a busca A* com h(n) = soma das distâncias de Manhattan compilada com Cython.
+    Requer que a extensão solucao_cython tenha sido compilada e importada.
+    :param estado: str
+    :return: list[str] | None
+    """
+    return solucao_cython.astar_manhattan(estado)
+
+
+def _astar_manhattan_numba(estado: str) -> list[str] | None:
+    """
+    Executa a busca A* com h(n) = soma das distâncias de Manhattan compilada com Numba.
+    Requer que o módulo solucao_numba tenha sido importado.
     :param estado: str
     :return: list[str] | None
     """
-    objetivo = "12345678_"
+    return solucao_numba.astar_manhattan(empacota(estado), estado.index("_"))
 
-    nodo_raiz = Nodo(estado)
+
+def _astar_manhattan_python(estado: str) -> list[str] | None:
+    """
+    Implementação em Python puro da busca A* com h(n) = soma das distâncias de Manhattan,
+    usada por astar_manhattan quando nenhuma versão compilada está disponível.
+    :param estado: str
+    :return: list[str] | None
+    """
+    estado_raiz = empacota(estado)
 
     explorados = set()
 
-    # Fila de prioridade para a fronteira, ordenada pelo custo f(n) = g(n) + h(n)
-    fronteira = []
+    # Menor custo g(n) conhecido para cada estado
+    g_score = {estado_raiz: 0}
+
+    # Para cada estado atingido: (estado pai, código da ação que leva do pai ao estado)
+    came_from = {}
+
+    # Fila de prioridade para a fronteira, ordenada pelo custo f(n) = g(n) + h(n).
+    # Cada entrada é uma tupla (g(n), estado, posição do vazio, h(n))
+    fronteira = FilaDeBaldes()
 
-    # Adiciona o nó raiz à fronteira
-    heapq.heappush(fronteira, (manhattan_heuristic(nodo_raiz.estado), nodo_raiz))
+    # Adiciona o estado raiz à fronteira
+    custo_h = _manhattan_empacotado(estado_raiz)
+    fronteira.insere(custo_h, (0, estado_raiz, estado.index("_"), custo_h))
 
     while fronteira:
-        # Extrai o nó com menor custo f(n) da fronteira
-        _, nodo_atual = heapq.heappop(fronteira)
-
-        # Verifica se o nó atual é o objetivo
-        if nodo_atual.estado == objetivo:
-            # Reconstrói o caminho a partir do nó objetivo
-            caminho = []
-            while nodo_atual.pai is not None:
-                caminho.append(nodo_atual.acao)
-                nodo_atual = nodo_atual.pai
-            caminho.reverse()
-            return caminho
-
-        explorados.add(nodo_atual.estado)
-
-        # Expande o nó atual e adiciona os sucessores não explorados à fronteira
-        for nodo_sucessor in expande(nodo_atual):
-            if nodo_sucessor.estado not in explorados:
-                custo_f = nodo_sucessor.custo + manhattan_heuristic(nodo_sucessor.estado)
-                heapq.heappush(fronteira, (custo_f, nodo_sucessor))
+        # Extrai a entrada com menor custo f(n) da fronteira
+        custo_atual, estado_atual, vazio_atual, h_atual = fronteira.remove()
+
+        # Um estado pode ter entrado na fronteira mais de uma vez; só a primeira retirada é expandida
+        if estado_atual in explorados:
+            continue
+
+        # Verifica se o estado atual é o objetivo
+        if estado_atual == OBJETIVO_EMPACOTADO:
+            return _reconstroi_caminho(came_from, estado_atual)
+
+        explorados.add(estado_atual)
+
+        # Gera os sucessores e adiciona à fronteira os que melhoram g(n)
+        for acao, novo_estado, novo_vazio in _sucessor_empacotado(estado_atual, vazio_atual):
+            custo_g = custo_atual + 1
+            # Os estados explorados já têm g(n) ótimo (as heurísticas são consistentes),
+            # então o teste contra g_score também descarta os já explorados
+            if custo_g < g_score.get(novo_estado, inf):
+                g_score[novo_estado] = custo_g
+                came_from[novo_estado] = (estado_atual, acao)
+                # Apenas a peça movida muda de posição, então h(n) é atualizado a partir do pai
+                indice = ((estado_atual >> (4 * novo_vazio)) & 0xF) * 9
+                custo_h = h_atual - MANHATTAN[indice + novo_vazio] + MANHATTAN[indice + vazio_atual]
+                fronteira.insere(custo_g + custo_h, (custo_g, novo_estado, novo_vazio, custo_h))
 
     return None
 
+def _tem_solucao(estado: int) -> bool:
+    """
+    Verifica se o objetivo é alcançável a partir de um estado empacotado: no 8-puzzle,
+    isso ocorre se e somente se o número de inversões entre as peças é par.
+    :param estado: int
+    :return: bool
+    """
+    pecas = []
+    for i in range(9):
+        peca = (estado >> (4 * i)) & 0xF
+        if peca != 0:
+            pecas.append(peca)
+    inversoes = 0
+    for i in range(len(pecas)):
+        for j in range(i + 1, len(pecas)):
+            if pecas[i] > pecas[j]:
+                inversoes += 1
+    return inversoes % 2 == 0
+
+
+def _conflitos_lineares(estado: int) -> int:
+    """
+    Calcula o custo extra de conflitos lineares de um estado empacotado, somando a
+    contribuição de cada linha e de cada coluna do tabuleiro.
+    :param estado: int
+    :return: int
+    """
+    conflitos = 0
+    for linha in range(3):
+        conflitos += CONFLITOS_LINHAS[linha][(estado >> (12 * linha)) & 0xFFF]
+    for coluna in range(3):
+        chave = (((estado >> (4 * coluna)) & 0xF)
+                 | (((estado >> (4 * (coluna + 3))) & 0xF) << 4)
+                 | (((estado >> (4 * (coluna + 6))) & 0xF) << 8))
+        conflitos += CONFLITOS_COLUNAS[coluna][chave]
+    return conflitos
+
+
+def _busca_limitada(estado: int, vazio: int, vazio_anterior: int, custo_g: int, custo_h: int,
+                    limite: int, caminho: list[int]) -> int | None:
+    """
+    Busca em profundidade do IDA*, limitada por f(n) <= limite, com h(n) = distância de
+    Manhattan (custo_h, atualizada incrementalmente) + conflitos lineares. Os códigos das ações do
+    caminho atual são mantidos em caminho. Retorna None se o objetivo foi encontrado ou, caso contrário,
+    o menor f(n) que excedeu o limite.
+    :return: int | None
+    """
+    custo_f = custo_g + custo_h + _conflitos_lineares(estado)
+    if custo_f > limite:
+        return custo_f
+    if estado == OBJETIVO_EMPACOTADO:
+        return None
+
+    menor = inf
+    for acao, novo_estado, novo_vazio in _sucessor_empacotado(estado, vazio):
+        # Não desfaz o movimento anterior
+        if novo_vazio == vazio_anterior:
+            continue
+        # Apenas a peça movida muda de posição, então h(n) é atualizado a partir do pai
+        indice = ((estado >> (4 * novo_vazio)) & 0xF) * 9
+        novo_h = custo_h - MANHATTAN[indice + novo_vazio] + MANHATTAN[indice + vazio]
+
+        caminho.append(acao)
+        resultado = _busca_limitada(novo_estado, novo_vazio, vazio, custo_g + 1, novo_h, limite, caminho)
+        if resultado is None:
+            return None
+        caminho.pop()
+        menor = min(menor, resultado)
+    return menor
+
+
+def astar_new_heuristic(estado: str) -> list[str] | None:
+    """
+    Recebe um estado (string), executa a busca IDA* (A* com aprofundamento iterativo) com
+    h(n) = soma das distâncias de Manhattan + conflitos lineares e retorna uma lista de ações que leva do
+    estado recebido até o objetivo ("12345678_"). Usa memória proporcional à profundidade
+    da solução, sem fila de prioridade nem conjunto de explorados.
+    Caso não haja solução a partir do estado recebido, retorna None.
+    :param estado: str
+    :return: list[str] | None
+    """
+    estado_raiz = empacota(estado)
+
+    # Sem solução, o aprofundamento iterativo nunca terminaria
+    if not _tem_solucao(estado_raiz):
+        return None
+
+    caminho = []
+    manhattan_raiz = _manhattan_empacotado(estado_raiz)
+    limite = manhattan_raiz + _conflitos_lineares(estado_raiz)
+    while True:
+        limite = _busca_limitada(estado_raiz, estado.index("_"), -1, 0, manhattan_raiz, limite, caminho)
+        if limite is None:
+            return [ACOES[acao] for acao in caminho]
+
+
 def manhattan_heuristic(estado: str) -> int:
     """
     Calcula a soma das distâncias de Manhattan entre o estado atual e o estado objetivo.
     :param estado: str
     :return: int
     """
-    objetivo = "12345678_"
+    return _manhattan_empacotado(empacota(estado))
+
 
+def _manhattan_empacotado(estado: int) -> int:
+    """
+    Calcula a soma das distâncias de Manhattan para um estado empacotado,
+    consultando a tabela MANHATTAN para cada peça.
+    :param estado: int
+    :return: int
+    """
     distancia = 0
 
     for i in range(9):
-        if estado[i] != "_":
-            posicao_correta = objetivo.index(estado[i])
-            linha_correta, coluna_correta = posicao_correta // 3, posicao_correta % 3
-            linha_atual, coluna_atual = i // 3, i % 3
-            distancia += abs(linha_correta - linha_atual) + abs(coluna_correta - coluna_atual)
+        distancia += MANHATTAN[(estado & 0xF) * 9 + i]
+        estado >>= 4
     return distancia
 
 def bfs(estado:str)->list[str] | None:
@@ -250,32 +537,30 @@ def bfs(estado:str)->list[str] | None:
     :param estado: str
     :return:
     """
-    objetivo = "12345678_"
-
-    nodo_raiz = Nodo(estado)
+    estado_raiz = empacota(estado)
 
-    if nodo_raiz.estado == objetivo:
+    if estado_raiz == OBJETIVO_EMPACOTADO:
         return []
 
-    fila = [nodo_raiz]
-    explorados = set()
+    # Cada entrada da fila é uma tupla (estado, posição do vazio)
+    fila = deque([(estado_raiz, estado.index("_"))])
+    # Estados que já entraram na fila, explorados ou não. Todo estado gerado
+    # fica nela até ser explorado, então um único conjunto substitui ambos os testes
+    visitados = {estado_raiz}
+    # Para cada estado atingido: (estado pai, código da ação que leva do pai ao estado)
+    came_from = {}
 
     while fila:
-        nodo_atual = fila.pop(0)
-        explorados.add(nodo_atual.estado)
+        estado_atual, vazio_atual = fila.popleft()
 
-        for nodo_sucessor in expande(nodo_atual):
-            if nodo_sucessor.estado not in explorados and all(nodo_sucessor.estado != n.estado for n in fila):
-                if nodo_sucessor.estado == objetivo:
-                    caminho = []
+        for acao, novo_estado, novo_vazio in _sucessor_empacotado(estado_atual, vazio_atual):
+            if novo_estado not in visitados:
+                came_from[novo_estado] = (estado_atual, acao)
+                if novo_estado == OBJETIVO_EMPACOTADO:
+                    return _reconstroi_caminho(came_from, novo_estado)
 
-                    while nodo_sucessor.pai:
-                        caminho.append(nodo_sucessor.acao)
-                        nodo_sucessor = nodo_sucessor.pai
-
-                    return caminho[::-1]
-
-                fila.append(nodo_sucessor)
+                fila.append((novo_estado, novo_vazio))
+                visitados.add(novo_estado)
     
     return None
 
@@ -288,31 +573,29 @@ def dfs(estado:str)->list[str] | None:
     :param estado: str
     :return:
     """
-    objetivo = "12345678_"
-
-    nodo_raiz = Nodo(estado)
+    estado_raiz = empacota(estado)
 
-    if nodo_raiz.estado == objetivo:
+    if estado_raiz == OBJETIVO_EMPACOTADO:
         return []
 
-    pilha = [nodo_raiz]
-    explorados = set()
+    # Cada entrada da pilha é uma tupla (estado, posição do vazio)
+    pilha = [(estado_raiz, estado.index("_"))]
+    # Estados que já entraram na pilha, explorados ou não. Todo estado gerado
+    # fica nela até ser explorado, então um único conjunto substitui ambos os testes
+    visitados = {estado_raiz}
+    # Para cada estado atingido: (estado pai, código da ação que leva do pai ao estado)
+    came_from = {}
 
     while pilha:
-        nodo_atual = pilha.pop()
-        explorados.add(nodo_atual.estado)
-
-        for nodo_sucessor in expande(nodo_atual):
-            if nodo_sucessor.estado not in explorados and all(nodo_sucessor.estado != n.estado for n in pilha):
-                if nodo_sucessor.estado == objetivo:
-                    caminho = []
-
-                    while nodo_sucessor.pai:
-                        caminho.append(nodo_sucessor.acao)
-                        nodo_sucessor = nodo_sucessor.pai
+        estado_atual, vazio_atual = pilha.pop()
 
-                    return caminho[::-1]
+        for acao, novo_estado, novo_vazio in _sucessor_empacotado(estado_atual, vazio_atual):
+            if novo_estado not in visitados:
+                came_from[novo_estado] = (estado_atual, acao)
+                if novo_estado == OBJETIVO_EMPACOTADO:
+                    return _reconstroi_caminho(came_from, novo_estado)
 
-                pilha.append(nodo_sucessor)
+                pilha.append((novo_estado, novo_vazio))
+                visitados.add(novo_estado)
     
     return None
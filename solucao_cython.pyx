@@ -0,0 +1,148 @@
+# distutils: language = c++
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Implementação do A* com distância de Manhattan em Cython, tipada com uint64_t sobre o
+estado empacotado definido em tabuleiro.py. O objetivo, a ordem das ações e as tabelas
+de movimentos e de distâncias de Manhattan são copiados de lá na importação.
+Compilar com: cythonize -i solucao_cython.pyx
+"""
+from libc.stdint cimport int64_t, uint64_t
+from libcpp.pair cimport pair
+from libcpp.queue cimport priority_queue
+from libcpp.unordered_map cimport unordered_map
+from libcpp.vector cimport vector
+
+import tabuleiro
+from tabuleiro import ACOES, empacota
+
+cdef uint64_t OBJETIVO_EMPACOTADO = tabuleiro.OBJETIVO_EMPACOTADO
+
+# Seleciona os 36 bits do estado dentro de uma entrada da fronteira
+cdef uint64_t MASCARA_ESTADO = 0xFFFFFFFFF
+
+# Distância de Manhattan indexada por peca * 9 + posicao (16 valores possíveis por nibble)
+cdef int MANHATTAN[144]
+
+# Nova posição do vazio para cada (posição do vazio, ação), ou -1 se a ação não é possível
+cdef int MOVIMENTOS[9][4]
+
+
+cdef void _copia_tabelas():
+    """
+    Preenche os arrays C MANHATTAN e MOVIMENTOS a partir das tabelas de tabuleiro.py.
+    """
+    cdef int i, vazio, acao, novo_vazio
+    for i in range(144):
+        MANHATTAN[i] = tabuleiro.MANHATTAN[i] if i < len(tabuleiro.MANHATTAN) else 0
+    for vazio in range(9):
+        for acao in range(4):
+            MOVIMENTOS[vazio][acao] = -1
+        for acao, novo_vazio in tabuleiro.VIZINHOS[vazio]:
+            MOVIMENTOS[vazio][acao] = novo_vazio
+
+
+_copia_tabelas()
+
+
+cdef inline uint64_t swap_nibbles(uint64_t s, int i, int j) noexcept nogil:
+    """
+    Troca o conteúdo das posições i e j de um estado empacotado.
+    """
+    cdef uint64_t mascara_i = (<uint64_t>0xF) << (4 * i)
+    cdef uint64_t mascara_j = (<uint64_t>0xF) << (4 * j)
+    cdef uint64_t peca_i = (s & mascara_i) >> (4 * i)
+    cdef uint64_t peca_j = (s & mascara_j) >> (4 * j)
+    return (s & ~(mascara_i | mascara_j)) | (peca_i << (4 * j)) | (peca_j << (4 * i))
+
+
+cdef int manhattan_h(uint64_t s) noexcept nogil:
+    """
+    Calcula a soma das distâncias de Manhattan de um estado empacotado.
+    """
+    cdef int distancia = 0
+    cdef int i
+    for i in range(9):
+        distancia += MANHATTAN[((s >> (4 * i)) & 0xF) * 9 + i]
+    return distancia
+
+
+cdef bint _astar_manhattan(uint64_t estado, int vazio, vector[int]& caminho) noexcept nogil:
+    """
+    Núcleo do A*. Preenche caminho com os códigos das ações e retorna se houve solução.
+    A chave da fila combina f(n) nos bits altos com um contador monotônico (negados, pois
+    priority_queue é um heap de máximo), garantindo desempate FIFO entre f iguais.
+    A entrada guarda o estado (36 bits), g(n) (8 bits) e a posição do vazio (4 bits).
+    """
+    cdef priority_queue[pair[int64_t, uint64_t]] fronteira
+    cdef unordered_map[uint64_t, int] g_score
+    # Para cada estado: (estado pai << 2) | código da ação
+    cdef unordered_map[uint64_t, uint64_t] came_from
+    cdef pair[int64_t, uint64_t] topo
+    cdef int64_t contador = 0
+    cdef uint64_t estado_atual, novo_estado, anterior
+    cdef int custo_atual, vazio_atual, h_atual, custo_g, custo_h, novo_vazio, acao, indice, i
+
+    g_score[estado] = 0
+    fronteira.push(pair[int64_t, uint64_t](-((<int64_t>manhattan_h(estado) << 40) | contador),
+                                           estado | (<uint64_t>vazio << 44)))
+
+    while not fronteira.empty():
+        topo = fronteira.top()
+        fronteira.pop()
+        estado_atual = topo.second & MASCARA_ESTADO
+        custo_atual = <int>((topo.second >> 36) & 0xFF)
+        vazio_atual = <int>(topo.second >> 44)
+
+        # Descarta entradas obsoletas
+        if custo_atual > g_score[estado_atual]:
+            continue
+
+        if estado_atual == OBJETIVO_EMPACOTADO:
+            caminho.resize(custo_atual)
+            for i in range(custo_atual - 1, -1, -1):
+                anterior = came_from[estado_atual]
+                caminho[i] = <int>(anterior & 0x3)
+                estado_atual = anterior >> 2
+            return True
+
+        h_atual = <int>((-topo.first) >> 40) - custo_atual
+        custo_g = custo_atual + 1
+        for acao in range(4):
+            novo_vazio = MOVIMENTOS[vazio_atual][acao]
+            if novo_vazio < 0:
+                continue
+            novo_estado = swap_nibbles(estado_atual, vazio_atual, novo_vazio)
+            if g_score.count(novo_estado) and custo_g >= g_score[novo_estado]:
+                continue
+            g_score[novo_estado] = custo_g
+            came_from[novo_estado] = (estado_atual << 2) | <uint64_t>acao
+
+            # Apenas a peça movida muda de posição, então h(n) é atualizado a partir do pai
+            indice = <int>((estado_atual >> (4 * novo_vazio)) & 0xF) * 9
+            custo_h = h_atual - MANHATTAN[indice + novo_vazio] + MANHATTAN[indice + vazio_atual]
+
+            contador += 1
+            fronteira.push(pair[int64_t, uint64_t](-((<int64_t>(custo_g + custo_h) << 40) | contador),
+                                                   novo_estado | (<uint64_t>custo_g << 36)
+                                                   | (<uint64_t>novo_vazio << 44)))
+
+    return False
+
+
+def astar_manhattan(estado: str) -> list[str] | None:
+    """
+    Recebe um estado (string), executa a busca A* compilada com h(n) = soma das distâncias
+    de Manhattan e retorna a lista de ações até o objetivo ("12345678_"), ou None caso
+    não haja solução.
+    :param estado: str
+    :return: list[str] | None
+    """
+    cdef vector[int] caminho
+    cdef uint64_t empacotado = empacota(estado)
+    cdef int vazio = estado.index("_")
+    cdef bint encontrou
+    with nogil:
+        encontrou = _astar_manhattan(empacotado, vazio, caminho)
+    if not encontrou:
+        return None
+    return [ACOES[codigo] for codigo in caminho]
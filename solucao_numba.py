@@ -0,0 +1,205 @@
+"""
+Implementação do A* com distância de Manhattan compilada com Numba (modo nopython).
+Opera sobre o estado empacotado definido em tabuleiro.py, de onde também vêm o objetivo,
+a ordem das ações e as tabelas de movimentos e de distâncias de Manhattan.
+"""
+import numpy as np
+from numba import njit, types
+from numba.typed import Dict
+
+import tabuleiro
+from tabuleiro import ACOES
+
+
+def _calcula_movimentos() -> np.ndarray:
+    """
+    Converte a tabela tabuleiro.VIZINHOS em um array 9x4 com a nova posição do vazio para
+    cada ação (indexada pelo código da ação), ou -1 se a ação não é possível.
+    :return: np.ndarray
+    """
+    movimentos = np.full((9, len(ACOES)), -1, dtype=np.int64)
+    for vazio, vizinhos in enumerate(tabuleiro.VIZINHOS):
+        for acao, novo_vazio in vizinhos:
+            movimentos[vazio, acao] = novo_vazio
+    return movimentos
+
+
+# As tabelas são passadas como argumento às funções compiladas (e não lidas como globais),
+# pois o cache da Numba congelaria os valores das globais na primeira compilação
+MOVIMENTOS = _calcula_movimentos()
+MANHATTAN = np.array(tabuleiro.MANHATTAN, dtype=np.int64)
+
+
+@njit(cache=True)
+def manhattan_h(estado: int, manhattan: np.ndarray) -> int:
+    """
+    Calcula a soma das distâncias de Manhattan de um estado empacotado.
+    :param estado: int
+    :param manhattan: np.ndarray, tabela indexada por peca * 9 + posicao
+    :return: int
+    """
+    distancia = 0
+    for i in range(9):
+        distancia += manhattan[((estado >> (4 * i)) & 0xF) * 9 + i]
+    return distancia
+
+
+@njit(cache=True)
+def sucessores(estado: int, vazio: int, movimentos: np.ndarray) -> np.ndarray:
+    """
+    Retorna um array 4x3 com (ação, estado atingido, nova posição do vazio) para cada ação;
+    linhas de ações impossíveis têm ação -1.
+    :param estado: int
+    :param vazio: int
+    :param movimentos: np.ndarray, tabela 9x4 de novas posições do vazio
+    :return: np.ndarray
+    """
+    retorno = np.full((4, 3), -1, dtype=np.int64)
+    for acao in range(4):
+        novo_vazio = movimentos[vazio, acao]
+        if novo_vazio >= 0:
+            # O vazio vale 0, então basta mover a peça de novo_vazio para vazio
+            peca = (estado >> (4 * novo_vazio)) & 0xF
+            retorno[acao, 0] = acao
+            retorno[acao, 1] = (estado & ~(0xF << (4 * novo_vazio))) | (peca << (4 * vazio))
+            retorno[acao, 2] = novo_vazio
+    return retorno
+
+
+@njit(cache=True)
+def _sobe(chaves, estados, custos, vazios, i):
+    """
+    Restaura a propriedade do heap subindo o elemento da posição i.
+    """
+    while i > 0:
+        pai = (i - 1) // 2
+        if chaves[pai] <= chaves[i]:
+            break
+        chaves[pai], chaves[i] = chaves[i], chaves[pai]
+        estados[pai], estados[i] = estados[i], estados[pai]
+        custos[pai], custos[i] = custos[i], custos[pai]
+        vazios[pai], vazios[i] = vazios[i], vazios[pai]
+        i = pai
+
+
+@njit(cache=True)
+def _desce(chaves, estados, custos, vazios, tamanho):
+    """
+    Restaura a propriedade do heap descendo o elemento da raiz.
+    """
+    i = 0
+    while True:
+        menor = i
+        esquerdo, direito = 2 * i + 1, 2 * i + 2
+        if esquerdo < tamanho and chaves[esquerdo] < chaves[menor]:
+            menor = esquerdo
+        if direito < tamanho and chaves[direito] < chaves[menor]:
+            menor = direito
+        if menor == i:
+            break
+        chaves[menor], chaves[i] = chaves[i], chaves[menor]
+        estados[menor], estados[i] = estados[i], estados[menor]
+        custos[menor], custos[i] = custos[i], custos[menor]
+        vazios[menor], vazios[i] = vazios[i], vazios[menor]
+        i = menor
+
+
+@njit(cache=True)
+def _cresce(array):
+    """
+    Retorna uma cópia do array com o dobro da capacidade.
+    """
+    novo = np.empty(2 * array.shape[0], dtype=array.dtype)
+    novo[:array.shape[0]] = array
+    return novo
+
+
+@njit(cache=True)
+def _astar_manhattan(estado, vazio, objetivo, movimentos, manhattan):
+    """
+    Núcleo do A*. Retorna (encontrou, códigos das ações do caminho).
+    O heap é formado por arrays paralelos; a chave combina f(n) nos bits altos com um
+    contador monotônico nos bits baixos, garantindo desempate FIFO entre f iguais.
+    """
+    capacidade = 1024
+    chaves = np.empty(capacidade, dtype=np.int64)
+    estados = np.empty(capacidade, dtype=np.int64)
+    custos = np.empty(capacidade, dtype=np.int64)
+    vazios = np.empty(capacidade, dtype=np.int64)
+
+    g_score = Dict.empty(key_type=types.int64, value_type=types.int64)
+    # Para cada estado: (estado pai << 2) | código da ação
+    came_from = Dict.empty(key_type=types.int64, value_type=types.int64)
+
+    contador = 0
+    g_score[estado] = 0
+    chaves[0] = (manhattan_h(estado, manhattan) << 32) | contador
+    estados[0] = estado
+    custos[0] = 0
+    vazios[0] = vazio
+    tamanho = 1
+
+    while tamanho > 0:
+        f_atual = chaves[0] >> 32
+        estado_atual, custo_atual, vazio_atual = estados[0], custos[0], vazios[0]
+
+        tamanho -= 1
+        chaves[0], estados[0], custos[0], vazios[0] = chaves[tamanho], estados[tamanho], custos[tamanho], vazios[tamanho]
+        _desce(chaves, estados, custos, vazios, tamanho)
+
+        # Descarta entradas obsoletas
+        if custo_atual > g_score[estado_atual]:
+            continue
+
+        if estado_atual == objetivo:
+            caminho = np.empty(custo_atual, dtype=np.int64)
+            for i in range(custo_atual - 1, -1, -1):
+                anterior = came_from[estado_atual]
+                caminho[i] = anterior & 0x3
+                estado_atual = anterior >> 2
+            return True, caminho
+
+        h_atual = f_atual - custo_atual
+        vizinhos = sucessores(estado_atual, vazio_atual, movimentos)
+        for k in range(4):
+            if vizinhos[k, 0] < 0:
+                continue
+            novo_estado, novo_vazio = vizinhos[k, 1], vizinhos[k, 2]
+            custo_g = custo_atual + 1
+            if novo_estado in g_score and custo_g >= g_score[novo_estado]:
+                continue
+            g_score[novo_estado] = custo_g
+            came_from[novo_estado] = (estado_atual << 2) | vizinhos[k, 0]
+
+            # Apenas a peça movida muda de posição, então h(n) é atualizado a partir do pai
+            indice = ((estado_atual >> (4 * novo_vazio)) & 0xF) * 9
+            custo_h = h_atual - manhattan[indice + novo_vazio] + manhattan[indice + vazio_atual]
+
+            if tamanho == chaves.shape[0]:
+                chaves = _cresce(chaves)
+                estados = _cresce(estados)
+                custos = _cresce(custos)
+                vazios = _cresce(vazios)
+            contador += 1
+            chaves[tamanho] = ((custo_g + custo_h) << 32) | contador
+            estados[tamanho] = novo_estado
+            custos[tamanho] = custo_g
+            vazios[tamanho] = novo_vazio
+            _sobe(chaves, estados, custos, vazios, tamanho)
+            tamanho += 1
+
+    return False, np.empty(0, dtype=np.int64)
+
+
+def astar_manhattan(estado: int, vazio: int) -> list[str] | None:
+    """
+    Recebe um estado empacotado e a posição do espaço vazio, executa a busca A* compilada
+    e retorna a lista de ações até o objetivo, ou None caso não haja solução.
+    :param estado: int
+    :param vazio: int
+    :return: list[str] | None
+    """
+    encontrou, caminho = _astar_manhattan(estado, vazio, tabuleiro.OBJETIVO_EMPACOTADO, MOVIMENTOS, MANHATTAN)
+    if not encontrou:
+        return None
+    return [ACOES[codigo] for codigo in caminho]
@@ -0,0 +1,86 @@
+"""
+Representação empacotada do tabuleiro do 8-puzzle e tabelas pré-calculadas compartilhadas
+pela solução em Python puro (solucao.py) e pelas versões compiladas (solucao_numba.py e
+solucao_cython.pyx). Alterar o objetivo ou a ordem das ações aqui vale para todas elas.
+"""
+
+
+def empacota(estado: str) -> int:
+    """
+    Converte um estado (string) para sua representação empacotada: um inteiro em que
+    cada posição i do tabuleiro ocupa os 4 bits a partir do bit 4*i (o espaço vazio vale 0).
+    :param estado: str
+    :return: int
+    """
+    empacotado = 0
+    for i in range(9):
+        if estado[i] != "_":
+            empacotado |= int(estado[i]) << (4 * i)
+    return empacotado
+
+
+# Nomes das ações, indexados pelo código usado internamente pelas buscas
+ACOES = ("esquerda", "direita", "acima", "abaixo")
+ESQUERDA, DIREITA, ACIMA, ABAIXO = range(4)
+
+
+def _calcula_vizinhos() -> list[tuple[tuple[int, int], ...]]:
+    """
+    Calcula, para cada posição do espaço vazio, os códigos das ações possíveis e a nova posição
+    do espaço vazio após cada uma delas, na ordem esquerda, direita, acima, abaixo.
+    :return: list[tuple[tuple[int, int], ...]]
+    """
+    vizinhos = []
+    for vazio in range(9):
+        linha, coluna = vazio // 3, vazio % 3
+        movimentos = []
+        if coluna > 0:
+            movimentos.append((ESQUERDA, vazio - 1))
+        if coluna < 2:
+            movimentos.append((DIREITA, vazio + 1))
+        if linha > 0:
+            movimentos.append((ACIMA, vazio - 3))
+        if linha < 2:
+            movimentos.append((ABAIXO, vazio + 3))
+        vizinhos.append(tuple(movimentos))
+    return vizinhos
+
+
+def _calcula_tabela_manhattan() -> list[int]:
+    """
+    Calcula a tabela de distâncias de Manhattan indexada por peca * 9 + posicao.
+    A peça p tem como posição correta p - 1; as entradas do espaço vazio (peça 0) valem 0.
+    :return: list[int]
+    """
+    tabela = [0] * 81
+    for peca in range(1, 9):
+        linha_correta, coluna_correta = (peca - 1) // 3, (peca - 1) % 3
+        for posicao in range(9):
+            linha_atual, coluna_atual = posicao // 3, posicao % 3
+            tabela[peca * 9 + posicao] = abs(linha_correta - linha_atual) + abs(coluna_correta - coluna_atual)
+    return tabela
+
+
+def _calcula_tabela_hamming() -> list[int]:
+    """
+    Calcula a tabela de Hamming indexada por peca * 9 + posicao: 1 se a peça está
+    fora da sua posição correta, 0 caso contrário (o espaço vazio sempre vale 0).
+    :return: list[int]
+    """
+    tabela = [0] * 81
+    for peca in range(1, 9):
+        for posicao in range(9):
+            tabela[peca * 9 + posicao] = int(posicao != peca - 1)
+    return tabela
+
+
+# Tabela de movimentos indexada pela posição do espaço vazio
+VIZINHOS = _calcula_vizinhos()
+
+# Distância de Manhattan de cada peça em cada posição do tabuleiro
+MANHATTAN = _calcula_tabela_manhattan()
+
+# Contribuição de cada peça em cada posição do tabuleiro para a distância de Hamming
+HAMMING = _calcula_tabela_hamming()
+
+OBJETIVO_EMPACOTADO = empacota("12345678_")
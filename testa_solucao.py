@@ -38,6 +38,25 @@ class TestaSolucao(unittest.TestCase):
             # verifica se a tupla com os atributos do nodo esta' presente no conjunto com os nodos esperados
             self.assertIn((nodo.estado, nodo.pai.estado, nodo.acao, nodo.custo), resposta_esperada)
 
+    def test_heuristicas(self):
+        """
+        Testa as distâncias de Hamming e de Manhattan com o espaço vazio na última posição
+        (onde ele não conta como peça fora do lugar) e em outra posição.
+        :return:
+        """
+        # espaço vazio na última posição
+        self.assertEqual(0, solucao.hamming_heuristic("12345678_"))
+        self.assertEqual(0, solucao.manhattan_heuristic("12345678_"))
+        self.assertEqual(2, solucao.hamming_heuristic("21345678_"))
+        self.assertEqual(2, solucao.manhattan_heuristic("21345678_"))
+        # espaço vazio em outra posição
+        self.assertEqual(1, solucao.hamming_heuristic("1234567_8"))
+        self.assertEqual(1, solucao.manhattan_heuristic("1234567_8"))
+        self.assertEqual(6, solucao.hamming_heuristic("2_3541687"))
+        self.assertEqual(11, solucao.manhattan_heuristic("2_3541687"))
+        self.assertEqual(7, solucao.hamming_heuristic("_87654321"))
+        self.assertEqual(20, solucao.manhattan_heuristic("_87654321"))
+
     def run_algorithm(self, alg, input):
         """
         Um helper que executa o algoritmo verificando timeout. Falha se der timeout
@@ -80,6 +99,44 @@ class TestaSolucao(unittest.TestCase):
         # nao ha solucao a partir do estado 185423_67
         self.assertIsNone(self.run_algorithm(solucao.astar_manhattan, "185423_67"))
     
+    def test_run_astar_new_heuristic(self):
+        """
+        Testa o IDA* com dist. Manhattan + conflitos lineares em um estado com solução e outro sem solução.
+        :return:
+        """
+        # no estado 2_3541687, a solucao otima tem 23 movimentos.
+        self.assertEqual(23, len(self.run_algorithm(solucao.astar_new_heuristic, "2_3541687")))
+
+        # nao ha solucao a partir do estado 185423_67
+        self.assertIsNone(self.run_algorithm(solucao.astar_new_heuristic, "185423_67"))
+
+    def test_run_astar_manhattan_python(self):
+        """
+        Testa a versão em Python puro do A* com dist. Manhattan, que astar_manhattan deixa
+        de usar quando há uma versão compilada disponível.
+        :return:
+        """
+        self.assertEqual(23, len(self.run_algorithm(solucao._astar_manhattan_python, "2_3541687")))
+        self.assertIsNone(self.run_algorithm(solucao._astar_manhattan_python, "185423_67"))
+
+    @unittest.skipIf(solucao.solucao_numba is None, "Numba não está instalada")
+    def test_run_astar_manhattan_numba(self):
+        """
+        Testa o A* compilado com Numba em um estado com solução e outro sem solução.
+        :return:
+        """
+        self.assertEqual(23, len(self.run_algorithm(solucao._astar_manhattan_numba, "2_3541687")))
+        self.assertIsNone(self.run_algorithm(solucao._astar_manhattan_numba, "185423_67"))
+
+    @unittest.skipIf(solucao.solucao_cython is None, "A extensão solucao_cython não foi compilada")
+    def test_run_astar_manhattan_cython(self):
+        """
+        Testa o A* compilado com Cython em um estado com solução e outro sem solução.
+        :return:
+        """
+        self.assertEqual(23, len(self.run_algorithm(solucao._astar_manhattan_cython, "2_3541687")))
+        self.assertIsNone(self.run_algorithm(solucao._astar_manhattan_cython, "185423_67"))
+
     def test_action_order(self):
         """
         Testa se A* retornam a sequencia de acoes na ordem correta
@@ -87,7 +144,13 @@ class TestaSolucao(unittest.TestCase):
         estado = "1235_6478"
         solucao_otima = ['esquerda', 'abaixo', 'direita', 'direita']
 
-        for alg in [solucao.astar_hamming, solucao.astar_manhattan]:
+        algoritmos = [solucao.astar_hamming, solucao.astar_manhattan, solucao._astar_manhattan_python,
+                      solucao.astar_new_heuristic]
+        if solucao.solucao_numba is not None:
+            algoritmos.append(solucao._astar_manhattan_numba)
+        if solucao.solucao_cython is not None:
+            algoritmos.append(solucao._astar_manhattan_cython)
+        for alg in algoritmos:
             self.assertEqual(solucao_otima, self.run_algorithm(alg, estado))
 
     def test_bfs(self):